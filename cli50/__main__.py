@@ -6,14 +6,9 @@ signal.signal(signal.SIGINT, lambda signum, frame: sys.exit(1))
 import argparse
 import gettext
 import os
-import re
-import requests
+import pathlib
 import shutil
 import subprocess
-import tzlocal
-
-from importlib.resources import files
-from packaging import version
 
 from . import __version__
 
@@ -32,13 +27,24 @@ PORTS = [
 # Tag to use
 TAG = "latest"
 
+# Seconds to wait for HTTP responses
+TIMEOUT = 5
+
+# Seconds for which to trust last check of PyPI for newer version
+VERSION_CHECK_TTL = 24 * 60 * 60
+
+# Hexadecimal digits, to recognize volume names (hashes) to ignore among mounts
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+# Memoized output of `docker ps`, keyed by filters
+_ps_cache = {}
+
 # Internationalization
-t = gettext.translation("cli50", str(files("cli50").joinpath("locale")), fallback=True)
+t = gettext.translation("cli50", os.path.join(os.path.dirname(__file__), "locale"), fallback=True)
 t.install()
 
 
 def main():
-
     # Listen for ctrl-c
     signal.signal(signal.SIGINT, handler)
 
@@ -54,14 +60,26 @@ def main():
     parser.add_argument("-t", "--tag", default=TAG, help=_("start {}:TAG, else {}:{}").format(IMAGE, IMAGE, TAG), metavar="TAG")
     parser.add_argument("-V", "--version", action="version", version="%(prog)s {}".format(__version__) if __version__ else "Locally installed.")
     parser.add_argument("directory", default=os.getcwd(), metavar="DIRECTORY", nargs="?", help=_("directory to mount, else $PWD"))
-    args = vars(parser.parse_args())
+    args = parser.parse_args()
+
+    # Check PyPI for newer version in the background
+    if __version__ and not args.fast:
+        release = background(latest_release)
+
+    # Check if Docker installed
+    if not shutil.which("docker"):
+        parser.error(_("Docker not installed."))
+
+    # Check Docker Hub for newer image in the background, on a daemon thread so that early exits needn't wait for it
+    if not args.fast and not args.login and not args.stop:
+        update = background(digests, IMAGE, args.tag)
 
-    # Check PyPI for newer version
-    if __version__ and not args["fast"]:
+    # Ask to upgrade if newer version on PyPI
+    if __version__ and not args.fast:
+        import http.client
         try:
-            release = max(requests.get("https://pypi.org/pypi/cli50/json").json()["releases"], key=version.parse)
-            assert release <= __version__
-        except requests.RequestException:
+            assert release.result() <= __version__
+        except (OSError, ValueError, http.client.HTTPException):
             pass
         except AssertionError:
             try:
@@ -73,26 +91,16 @@ def main():
                     print("Run `pip3 install --upgrade cli50` to upgrade. Then re-run cli50.")
                     sys.exit(0)
 
-    # Check if Docker installed
-    if not shutil.which("docker"):
-        parser.error(_("Docker not installed."))
-
-    # Check if Docker running
-    try:
-        stdout = subprocess.check_call(["docker", "info"], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL, timeout=10)
-    except subprocess.CalledProcessError:
-        sys.exit("Docker not running.")
-    except subprocess.TimeoutExpired:
-        sys.exit("Docker not responding.")
-
     # Log into container
-    if args["login"]:
+    if args.login:
 
         # If container specified
-        if isinstance(args["login"], str):
+        if isinstance(args.login, str):
             try:
-                print(ports(args["login"]))
-                login(args["login"])
+                print(ports(args.login))
+                login(args.login)
+            except subprocess.CalledProcessError as e:
+                sys.exit("Docker not running." if unreachable(e.stderr) else 1)
             except:
                 sys.exit(1)
             else:
@@ -100,113 +108,56 @@ def main():
 
         # Check for running containers
         try:
-            stdout = subprocess.check_output([
-                "docker", "ps",
-                "--all",
-                "--filter", "status=running",
-                "--format", "{{.ID}}\t{{.Image}}\t{{.RunningFor}}\t{{.Status}}\t{{.Mounts}}",
-                "--no-trunc"
-            ]).decode("utf-8")
-        except subprocess.CalledProcessError:
-            sys.exit(1)
-        else:
-            containers = []
-            for line in stdout.rstrip().splitlines():
-                ID, Image, RunningFor, Status, *Mounts = line.rstrip().split("\t")
-                Mounts = Mounts[0].split(",") if Mounts else []
-                Mounts = [re.sub(r"^/host_mnt", "", Mount) for Mount in Mounts if not re.match(r"^[0-9a-fA-F]{64}$", Mount)]  # Ignore hashes
-                containers.append((ID, Image, RunningFor.lower(), Status.lower(), Mounts))
+            containers = list_containers(["status=running"])
+        except subprocess.CalledProcessError as e:
+            sys.exit("Docker not running." if unreachable(e.stderr) else 1)
         if not containers:
             sys.exit("No containers are running.")
 
         # Ask whether to use a running container
-        import inflect, textwrap
-        for ID, Image, RunningFor, Status, Mounts in containers:
-            while True:
-                prompt = _("Log into {}, created {}, {}").format(Image, RunningFor, Status)
-                if Mounts:
-                    prompt += _(", with {} mounted").format(inflect.engine().join(Mounts))
-                prompt += "? [Y/n]    "  # Leave room when wrapping for "yes"
-                columns, lines = shutil.get_terminal_size()
-                prompt = "\n".join(textwrap.wrap(prompt, columns, drop_whitespace=False)).strip() + " "
+        import textwrap
+        columns, lines = shutil.get_terminal_size()
+        for ID, Image, RunningFor, Status, Mounts, Ports in containers:
+            prompt = _("Log into {}, created {}, {}").format(Image, RunningFor, Status)
+            if Mounts:
+                prompt += _(", with {} mounted").format(conjoin(Mounts))
+            prompt += "? [Y/n]    "  # Leave room when wrapping for "yes"
+            prompt = "\n".join(textwrap.wrap(prompt, columns, drop_whitespace=False)).strip() + " "
+            try:
+                stdin = input(prompt)
+            except EOFError:
+                break
+            if stdin.strip().lower() in ["", "y", "yes"]:
                 try:
-                    stdin = input(prompt)
-                except EOFError:
-                    break
-                if re.match(r"^\s*(?:y|yes)?\s*$", stdin, re.I):
-                    try:
-                        print(ports(ID))
-                        login(ID)
-                    except:
-                        sys.exit(1)
-                    else:
-                        sys.exit(0)
+                    print(ports(ID))
+                    login(ID)
+                except:
+                    sys.exit(1)
                 else:
-                    break
-        else:
-            sys.exit(0)
+                    sys.exit(0)
+        sys.exit(0)
 
     # Stop containers
-    if args["stop"]:
+    if args.stop:
         try:
-            stdout = subprocess.check_output([
-                "docker", "ps",
-                "--all",
-                "--filter", f"label={LABEL}",
-                "--format", "{{.ID}}"
-            ]).decode("utf-8")
-            for ID in stdout.rstrip().splitlines():
-                subprocess.check_call(["docker", "stop", "--time", "0", ID])
+
+            # Stop all at once, letting Docker stop them concurrently
+            if IDs := container_ids([f"label={LABEL}"]):
+                subprocess.check_call(["docker", "stop", "--time", "0", *IDs])
             sys.exit(0)
-        except subprocess.CalledProcessError:
-            sys.exit(1)
+        except subprocess.CalledProcessError as e:
+            sys.exit("Docker not running." if unreachable(e.stderr) else 1)
 
-    # Ensure directory exists
-    directory = os.path.realpath(args["directory"])
+    # Ensure directory exists (leaving any symlinks for Docker to resolve)
+    directory = os.path.abspath(args.directory)
     if not os.path.isdir(directory):
-        parser.error(_("{}: no such directory").format(args['directory']))
-
-    # Check Docker Hub for newer image
-    if not args["fast"]:
-
-        # Remote manifest
-        import json
-        try:
-            RemoteManifest = json.loads(subprocess.check_output([
-                "docker", "manifest", "inspect", f"{IMAGE}:{args['tag']}", "--verbose"
-            ], stderr=subprocess.DEVNULL).decode("utf-8"))
-        except subprocess.CalledProcessError:
-            RemoteManifest = None
-
-        # Local digest
-        try:
-            LocalDigest = json.loads(subprocess.check_output([
-                "docker", "inspect", f"{IMAGE}:{args['tag']}"
-            ], stderr=subprocess.DEVNULL).decode("utf-8"))[0]
-        except (IndexError, KeyError, subprocess.CalledProcessError):
-            LocalDigest = None
-
-        # Pull image if no local digest
-        if not LocalDigest:
-            pull(IMAGE, args["tag"])
-
-        # Ask to update image if local digest doesn't match any remote image digests
-        elif (LocalDigest and RemoteManifest) and \
-            LocalDigest['Id'] not in [manifest['SchemaV2Manifest']['config']['digest'] for manifest in RemoteManifest]:
-
-            try:
-                response = input(f"A newer version of {IMAGE}:{args['tag']} is available. Pull now? [Y/n] ")
-            except EOFError:
-                pass
-            else:
-                if response.strip().lower() not in ["n", "no"]:
-                    pull(IMAGE, args["tag"])
+        parser.error(_("{}: no such directory").format(args.directory))
 
     # Options
     workdir = "/mnt"
     options = ["--detach",
                "--env", f"LOCAL_WORKSPACE_FOLDER={directory}",
-               "--env", f"TZ={tzlocal.get_localzone_name()}",
+               "--env", f"TZ={timezone()}",
                "--env", f"WORKDIR={workdir}",
                "--interactive",
                "--label", LABEL,
@@ -222,63 +173,92 @@ def main():
         options += ["--env", f"LANG={lang}"]
 
     # Validate ports
-    if not args["port"]:
-        args["port"] = PORTS
-    for port in args["port"]:
+    if not args.port:
+        args.port = PORTS
+    for port in args.port:
         if port < 1024 or port > 65535:
             sys.exit(f"Invalid port: {port}")
         options += ["--expose", f"{port}"]
 
     # Home directory
-    home = os.path.join(os.path.expanduser("~"), "")
+    home = pathlib.Path.home()
 
     # Mount each dotfile in user's $HOME read-only in container's $HOME
-    for dotfile in args["dotfile"]:
-        if dotfile.startswith("/") and not dotfile.startswith(home):
+    for dotfile in args.dotfile:
+        path = home / (dotfile[2:] if dotfile.startswith(os.path.join("~", "")) else dotfile)
+        try:
+            relative = path.relative_to(home)
+        except ValueError:
             sys.exit(_("{}: not in your $HOME").format(dotfile))
-        elif dotfile.startswith(os.path.join("~", "")):
-            dotfile = os.path.expanduser(dotfile)
-        else:
-            dotfile = os.path.join(home, dotfile)
-        if not os.path.exists(dotfile):
-            sys.exit(_("{}: No such file or directory").format(dotfile))
-        if not dotfile[len(home):].startswith("."):
-            sys.exit(_("{}: Not a dotfile").format(dotfile))
-        options += ["--volume", "{}:/home/ubuntu/{}:ro".format(dotfile, dotfile[len(home):])]
+        if not path.exists():
+            sys.exit(_("{}: No such file or directory").format(path))
+        if not relative.parts or not relative.parts[0].startswith("."):
+            sys.exit(_("{}: Not a dotfile").format(path))
+        options += ["--volume", "{}:/home/ubuntu/{}:ro".format(path, relative)]
 
     # Default CMD
     cmd = ["bash", "--login"]
 
     # Serve Jekyll site
-    if args["jekyll"]:
+    if args.jekyll:
         cmd += ["-c", "bundle install && bundle exec jekyll serve --host 0.0.0.0 --port 8080"]
 
+    # Pull image if no local image, else ask to update image if it wasn't pulled with registry's digest
+    if not args.fast:
+        try:
+            LocalDigests, RemoteDigest = update.result()
+        except subprocess.CalledProcessError:
+            sys.exit("Docker not running.")
+        if LocalDigests is None:
+            pull(IMAGE, args.tag)
+        elif RemoteDigest and f"{IMAGE}@{RemoteDigest}" not in LocalDigests:
+            try:
+                response = input(f"A newer version of {IMAGE}:{args.tag} is available. Pull now? [Y/n] ")
+            except EOFError:
+                pass
+            else:
+                if response.strip().lower() not in ["n", "no"]:
+                    pull(IMAGE, args.tag)
+
     # Mount directory in new container
     try:
 
         # Publish all exposed ports to random ports
         container = subprocess.check_output(["docker", "run"] + options +
                                             ["--publish-all"] +
-                                            [f"{IMAGE}:{args['tag']}"] + cmd).decode("utf-8").rstrip()
+                                            [f"{IMAGE}:{args.tag}"] + cmd, encoding="utf-8").rstrip()
 
-        # Start Docker-outside-of-Docker (if supported by TAG)
+        # Start Docker-outside-of-Docker (if supported by TAG) while listing port mappings
         # a la https://github.com/devcontainers/features/blob/main/src/docker-outside-of-docker/install.sh
-        try:
-            subprocess.check_output(["docker", "exec", "--detach", container, "sudo", "/etc/init.d/docker", "start"])
-        except subprocess.CalledProcessError:
-            pass
-
-        # List port mappings
-        print(ports(container))
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=2) as launcher:
+            launcher.submit(subprocess.call, ["docker", "exec", "--detach", container, "sudo", "/etc/init.d/docker", "start"],
+                            stdout=subprocess.DEVNULL)
+            mappings = launcher.submit(ports, container)
+        print(mappings.result(), flush=True)
 
-        # Let user interact with container
-        print(subprocess.check_output(["docker", "logs", container]).decode("utf-8"), end="")
-        subprocess.call(["docker", "attach", container])
+        # Let user interact with container, replacing this process with docker's
+        subprocess.check_call(["docker", "logs", container])
+        os.execvp("docker", ["docker", "attach", container])
 
     except subprocess.CalledProcessError:
         sys.exit(1)
-    else:
-        sys.exit(0)
+
+
+def background(function, *args, **kwargs):
+    """Call function in a daemon thread, returning a Future for its result."""
+    import threading
+    from concurrent.futures import Future
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(function(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 def handler(number, frame):
@@ -289,12 +269,9 @@ def handler(number, frame):
 
 def login(container):
     """Log into container."""
-    columns, lines = shutil.get_terminal_size()  # Temporary
     try:
         subprocess.check_call([
             "docker", "exec",
-            "--env", f"COLUMNS={str(columns)},LINES={str(lines)}",  # Temporary
-            "--env", f"LINES={str(lines)}",  # Temporary
             "--interactive",
             "--tty",
             container,
@@ -305,43 +282,233 @@ def login(container):
         raise RuntimeError() from None
 
 
+def latest_release():
+    """Return latest release of cli50 on PyPI, caching it on disk."""
+    import json
+    import time
+    import urllib.error
+    import urllib.request
+    from packaging import version
+
+    # Load last check, if any
+    cache = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")), "cli50", "version_check.json")
+    try:
+        with open(cache) as f:
+            check = json.load(f)
+        assert "latest" in check
+    except (AssertionError, OSError, ValueError):
+        check = {}
+
+    # Trust last check if recent
+    if check and time.time() - check.get("timestamp", 0) < VERSION_CHECK_TTL:
+        return check["latest"]
+
+    # Ask PyPI, unless releases unchanged since last check
+    request = urllib.request.Request("https://pypi.org/pypi/cli50/json", headers={"If-None-Match": check["etag"]} if check.get("etag") else {})
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+            check = {
+                "etag": response.headers.get("ETag"),
+                "latest": max(json.load(response)["releases"], key=version.parse)
+            }
+    except urllib.error.HTTPError as e:
+        if e.code != 304:  # Not Modified
+            raise
+    check["timestamp"] = time.time()
+
+    # Remember check
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(cache, "w") as f:
+            json.dump(check, f)
+    except OSError:
+        pass
+    return check["latest"]
+
+
+def list_containers(filters=()):
+    """Return ID, image, age, status, mounts, and ports of each container matching filters, memoizing results."""
+    import json
+    import tempfile
+    key = tuple(filters)
+    if key not in _ps_cache:
+
+        # Parse rows as docker ps emits them, spooling stderr to a file so that it can't fill a pipe meanwhile
+        containers = []
+        malformed = False
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as errors, subprocess.Popen([
+            "docker", "ps",
+            "--all",
+            *[arg for f in filters for arg in ("--filter", f)],
+            "--format", "{{json .}}",
+            "--no-trunc"
+        ], stdout=subprocess.PIPE, stderr=errors, bufsize=1, encoding="utf-8") as process:
+            for line in process.stdout:
+
+                # Skip blank lines, treating any other unparseable line as failure
+                if not line.strip():
+                    continue
+                try:
+                    container = json.loads(line)
+                except ValueError:
+                    malformed = True
+                    continue
+                Mounts = [Mount[len("/host_mnt"):] if Mount.startswith("/host_mnt") else Mount
+                          for Mount in container["Mounts"].split(",") if Mount and not (len(Mount) == 64 and _HEX.issuperset(Mount))]  # Ignore hashes
+                containers.append((container["ID"], container["Image"], container["RunningFor"].lower(), container["Status"].lower(), Mounts, container["Ports"]))
+            process.wait()
+            errors.seek(0)
+            stderr = errors.read()
+        if process.returncode or malformed:
+            if not unreachable(stderr):
+                print(stderr, end="", file=sys.stderr)
+            raise subprocess.CalledProcessError(process.returncode or 1, process.args, stderr=stderr)
+        _ps_cache[key] = containers
+    return _ps_cache[key]
+
+
 def ports(container):
     """Return port mappings for container."""
 
-    # Get mappings
-    output = subprocess.check_output([
-        "docker", "ps",
-        "--filter", f"id={container}",
-        "--format", "{{.Ports}}",
-        "--no-trunc"
-    ]).decode("utf-8").rstrip()
+    # Get mappings, reusing any earlier `docker ps` that already listed container
+    rows = [row for cached in _ps_cache.values() for row in cached if row[0].startswith(container)]
+    output = ", ".join(Ports for ID, Image, RunningFor, Status, Mounts, Ports in rows or list_containers([f"id={container}"]))
 
     # Filter out IPv6 mappings as unneeded
-    mappings = list(filter(lambda mapping: not mapping.startswith(":::"), re.split(r", ", output)))
+    mappings = list(filter(lambda mapping: not mapping.startswith(":::"), output.split(", ")))
     return ", ".join(mappings)
 
 
-def pull(image, tag):
-    """Pull image as needed."""
+def conjoin(items):
+    """Return items as an English list (e.g., "a, b, and c"), as inflect.engine().join would."""
+    if len(items) < 3:
+        return " and ".join(items)
+    return ", ".join(items[:-1]) + ", and " + items[-1]
+
+
+def container_ids(filters=()):
+    """Return IDs of containers matching filters, asking Docker's API directly if possible."""
+    import http.client
+    import json
+    import socket
+    import urllib.parse
+
+    # Skip the Docker CLI if Docker listens on a local socket
+    if path := docker_socket():
+        query = {}
+        for f in filters:
+            key, sep, value = f.partition("=")
+            query.setdefault(key, []).append(value)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                connection = http.client.HTTPConnection("localhost")
+                connection.sock = sock
+                connection.request("GET", "/containers/json?" + urllib.parse.urlencode({"all": 1, "filters": json.dumps(query)}))
+                response = connection.getresponse()
+                if response.status == 200:
+                    return [container["Id"] for container in json.loads(response.read())]
+        except (OSError, ValueError, http.client.HTTPException):
+            pass
+
+    # Else ask the Docker CLI
+    return [ID for ID, *_ in list_containers(filters)]
+
+
+def docker_socket():
+    """Return path of Docker's UNIX socket, if the Docker CLI would use one, else None."""
     import json
+
+    # Respect DOCKER_HOST and contexts
+    if host := os.getenv("DOCKER_HOST"):
+        return host[len("unix://"):] if host.startswith("unix://") else None
+    if os.getenv("DOCKER_CONTEXT", "default") != "default":
+        return None
     try:
+        with open(os.path.join(os.getenv("DOCKER_CONFIG") or os.path.expanduser(os.path.join("~", ".docker")), "config.json")) as f:
+            if json.load(f).get("currentContext", "default") != "default":
+                return None
+    except (OSError, ValueError):
+        pass
 
-        # Get the latest manifest from registry
-        RemoteManifest = json.loads(subprocess.check_output([
-            "docker", "manifest", "inspect", f"{image}:{tag}", "--verbose"
-        ], stderr=subprocess.DEVNULL).decode("utf-8"))
+    # Default socket
+    path = "/var/run/docker.sock"
+    return path if os.path.exists(path) else None
 
-        # Get local image id, if any
-        localImageId = json.loads(subprocess.check_output([
-            "docker", "inspect", f"{image}:{tag}"], stderr=subprocess.DEVNULL).decode("utf-8"))[0]['Id']
 
-        # Pull latest if local image id does not match any digest in the manifest
-        assert localImageId in [manifest['SchemaV2Manifest']['config']['digest'] for manifest in RemoteManifest] == True
+def digests(image, tag):
+    """Return repo digests of local image:tag and digest of image:tag in registry, each None if unknown."""
+    import http.client
+    import json
+
+    # Ask registry and local image concurrently
+    remote = background(digest, image, tag)
+    local = background(subprocess.check_output, [
+        "docker", "image", "inspect", "--format", "{{json .RepoDigests}}", f"{image}:{tag}"
+    ], stderr=subprocess.PIPE, encoding="utf-8")
 
-    except (AssertionError, requests.exceptions.ConnectionError, subprocess.CalledProcessError):
+    # Remote digest
+    try:
+        RemoteDigest = remote.result()
+    except (OSError, ValueError, http.client.HTTPException):
+        RemoteDigest = None
 
-        # Pull image
-        subprocess.call(["docker", "pull", f"{image}:{tag}"], stderr=subprocess.DEVNULL)
+    # Local digests, propagating error if Docker isn't running
+    try:
+        LocalDigests = json.loads(local.result()) or []
+    except subprocess.CalledProcessError as e:
+        if unreachable(e.stderr):
+            raise
+        LocalDigests = None
+
+    return LocalDigests, RemoteDigest
+
+
+def digest(image, tag):
+    """Return digest of image:tag in registry, else None."""
+    import json
+    import urllib.parse
+    import urllib.request
+
+    # Get an anonymous token for registry
+    with urllib.request.urlopen("https://auth.docker.io/token?" + urllib.parse.urlencode({
+        "scope": f"repository:{image}:pull",
+        "service": "registry.docker.io"
+    }), timeout=TIMEOUT) as response:
+        token = json.load(response).get("token")
+    if not token:
+        return None
+
+    # Get digest from headers alone
+    with urllib.request.urlopen(urllib.request.Request(f"https://registry-1.docker.io/v2/{image}/manifests/{tag}", headers={
+        "Accept": ", ".join([
+            "application/vnd.docker.distribution.manifest.list.v2+json",
+            "application/vnd.docker.distribution.manifest.v2+json",
+            "application/vnd.oci.image.index.v1+json",
+            "application/vnd.oci.image.manifest.v1+json"
+        ]),
+        "Authorization": f"Bearer {token}"
+    }, method="HEAD"), timeout=TIMEOUT) as response:
+        return response.headers.get("Docker-Content-Digest")
+
+
+def timezone():
+    """Return name of local timezone, else UTC."""
+    import tzlocal
+    try:
+        return tzlocal.get_localzone_name() or "UTC"
+    except (KeyError, ValueError):  # e.g., ZoneInfoNotFoundError
+        return "UTC"
+
+
+def unreachable(stderr):
+    """Return whether stderr of a docker command indicates that Docker isn't running."""
+    return any(message in (stderr or "") for message in ["Cannot connect to the Docker daemon", "error during connect"])
+
+
+def pull(image, tag):
+    """Pull image."""
+    subprocess.call(["docker", "pull", f"{image}:{tag}"], stderr=subprocess.DEVNULL)
 
 
 if __name__ == "__main__":